@@ -1,21 +1,34 @@
 import enum
 import hashlib
 import json
-import locale
 import os
+import re
 import uuid
-from copy import deepcopy
-from datetime import date, timedelta, datetime as dt
-from re import search
+from datetime import timedelta, datetime as dt
+from functools import lru_cache
+from operator import attrgetter
+from secrets import randbelow
 from dateutil.tz.tz import tzlocal
 from typing import List
 
-from sqlalchemy import MetaData, Column, Integer, String, Float, Boolean, DateTime, Enum
+from sqlalchemy import (
+    MetaData,
+    Column,
+    Integer,
+    String,
+    Float,
+    Boolean,
+    Date,
+    DateTime,
+    Enum,
+    inspect,
+    select,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql.schema import ForeignKey
-from sqlalchemy.orm import relationship, backref, Mapped, mapped_column
+from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.orm.mapper import validates
-from stringcase import camelcase, snakecase
+import stringcase
 
 from constants import (
     ALERT_AWAY,
@@ -28,16 +41,41 @@ from constants import (
 )
 from tools.dictionary import merge_dicts, replace_keys
 
+# the attribute names are a small, fixed set: cache the (regex based) conversion
+camelcase = lru_cache(maxsize=512)(stringcase.camelcase)
+
+INPUT_NUMBER = int(os.environ.get("INPUT_NUMBER", 15))
+OUTPUT_NUMBER = int(os.environ.get("OUTPUT_NUMBER", 8))
+
+EMAIL_FORMAT = re.compile(r"^[a-z0-9]+[\._]?[a-z0-9]+[@]\w+[.]\w{2,3}$")
+
 
 def hash_code(access_code):
-    return hashlib.sha256(
-        (f"{access_code}:{os.environ.get('SALT')}").encode("utf-8")
-    ).hexdigest()
+    # the salt is read on every call: secrets.env can be loaded after this import
+    code_hash = hashlib.sha256(str(access_code).encode("utf-8"))
+    code_hash.update(f":{os.environ.get('SALT')}".encode("utf-8"))
+    return code_hash.hexdigest()
+
 
+def generate_id():
+    """Random 8 digit identifier"""
+    return 10_000_000 + randbelow(90_000_000)
 
-def convert2camel(data):
-    """Convert the attribute names of the dictonary to camel case for compatibility with angular"""
-    return {camelcase(key): value for key, value in data.items()}
+
+@lru_cache(maxsize=128)
+def get_attribute_keys(attributes):
+    """Map the accepted keys (camel and snake case) of the incoming data to the attributes"""
+    attribute_keys = {camelcase(attribute): attribute for attribute in attributes}
+    attribute_keys.update((attribute, attribute) for attribute in attributes)
+    return attribute_keys
+
+
+def format_datetime(value, sep=" "):
+    """Format the date and time without microseconds and timezone (YYYY-MM-DD HH:MM:SS)"""
+    return (
+        f"{value.year:04}-{value.month:02}-{value.day:02}{sep}"
+        f"{value.hour:02}:{value.minute:02}:{value.second:02}"
+    )
 
 
 class ArmStates(str, enum.Enum):
@@ -48,17 +86,24 @@ class ArmStates(str, enum.Enum):
 
     @staticmethod
     def merge(as1, as2):
-        if as1 == as2:
-            return as1
-        elif as1 != ArmStates.DISARM and as2 != ArmStates.DISARM:
-            return ArmStates.MIXED
-        elif as1 == ArmStates.DISARM or as2 == ArmStates.DISARM:
-            if as1 == ArmStates.DISARM:
-                return as2
-            elif as2 == ArmStates.DISARM:
-                return as1
-        else:
-            return ArmStates.DISARM
+        return ARM_STATE_MERGES[(ArmStates(as1), ArmStates(as2))]
+
+
+def _merge_arm_states(as1, as2):
+    if as1 == as2:
+        return as1
+    elif as1 != ArmStates.DISARM and as2 != ArmStates.DISARM:
+        return ArmStates.MIXED
+    elif as1 == ArmStates.DISARM:
+        return as2
+    else:
+        return as1
+
+
+# merged arm state of all the combinations of two arm states
+ARM_STATE_MERGES = {
+    (as1, as2): _merge_arm_states(as1, as2) for as1 in ArmStates for as2 in ArmStates
+}
 
 
 metadata = MetaData()
@@ -70,42 +115,109 @@ class BaseModel(Base):
 
     __abstract__ = True
 
-    def __init__(self, *args):
-        super().__init__(*args)
+    # attributes of the JSON representation (see serialized)
+    SERIALIZED_ATTRIBUTES = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # pairs of the attribute name and the camel case key for compatibility with angular
+        cls._serialized_keys = tuple(
+            (attribute, camelcase(attribute)) for attribute in cls.SERIALIZED_ATTRIBUTES
+        )
+        # fetch the values with one call (attrgetter only returns a tuple for 2+ names)
+        attributes = cls.SERIALIZED_ATTRIBUTES
+        if len(attributes) > 1:
+            cls._serialized_values = attrgetter(*attributes)
+        else:
+            # static: a plain function on the class would be bound to the instance
+            cls._serialized_values = staticmethod(
+                lambda instance: tuple(
+                    getattr(instance, attribute) for attribute in attributes
+                )
+            )
+
+    @classmethod
+    def get_column_names(cls):
+        """Names of the column attributes (collected on the first call)"""
+        if "_column_names" not in cls.__dict__:
+            columns = inspect(cls).column_attrs
+            cls._column_names = tuple(column.key for column in columns)
+            # the date columns are formatted by json()
+            cls._date_column_names = tuple(
+                column.key
+                for column in columns
+                if isinstance(column.expression.type, (Date, DateTime))
+            )
+            cls._plain_column_names = tuple(
+                name for name in cls._column_names if name not in cls._date_column_names
+            )
+        return cls._column_names
 
     def __repr__(self):
-        """Define a base way to print models"""
-        return f"{self.__class__.__name__}({dict(self.__dict__.items())})"
+        """Define a base way to print models (only the loaded columns)"""
+        values = {
+            name: self.__dict__[name]
+            for name in self.get_column_names()
+            if name in self.__dict__
+        }
+        return f"{self.__class__.__name__}({values})"
 
     def json(self):
         """
         Define a base way to jsonify models, dealing with datetime objects
         """
-        return {
-            column: value.strftime("%Y-%m-%d") if isinstance(value, date) else value
-            for column, value in self.__dict__.items()
-        }
+        self.get_column_names()
+        serialized = {name: getattr(self, name) for name in self._plain_column_names}
+        for name in self._date_column_names:
+            value = getattr(self, name)
+            serialized[name] = value.strftime("%Y-%m-%d") if value else None
+
+        return serialized
 
     def update_record(self, attributes, data):
         """Update the given attributes of the record (dict) based on a dictionary"""
+        attribute_keys = get_attribute_keys(tuple(attributes))
         record_changed = False
         for key, value in data.items():
-            snake_key = snakecase(key)
-            if snake_key in attributes and value != getattr(self, snake_key, value):
+            snake_key = attribute_keys.get(key)
+            if snake_key and value != getattr(self, snake_key, value):
                 setattr(self, snake_key, value)
                 record_changed = True
         return record_changed
 
-    def serialize_attributes(self, attributes):
-        """Create JSON object with given attributes"""
-        serialized = {}
-        for attribute in attributes:
-            value = getattr(self, attribute, None)
-            if isinstance(value, dt):
-                value = value.replace(microsecond=0, tzinfo=None).isoformat(sep=" ")
-            serialized[attribute] = value
+    def serialize_attributes(self):
+        """Create JSON object with the serialized attributes of the model"""
+        return {
+            key: format_datetime(value) if isinstance(value, dt) else value
+            for (_, key), value in zip(
+                self._serialized_keys, self._serialized_values(self)
+            )
+        }
 
-        return serialized
+    @property
+    def serialized(self):
+        return self.serialize_attributes()
+
+    @classmethod
+    def select_serialized(cls):
+        """
+        Select the serialized attributes as plain rows (without loading model instances)
+        """
+        return select(
+            *(getattr(cls, attribute) for attribute, _ in cls._serialized_keys)
+        )
+
+    @classmethod
+    def serialize_rows(cls, rows):
+        """Create JSON objects from the rows of select_serialized"""
+        keys = tuple(key for _, key in cls._serialized_keys)
+        return [
+            {
+                key: format_datetime(value) if isinstance(value, dt) else value
+                for key, value in zip(keys, row)
+            }
+            for row in rows
+        ]
 
 
 class SensorType(BaseModel):
@@ -115,19 +227,19 @@ class SensorType(BaseModel):
 
     NAME_LENGTH = 16
 
+    SERIALIZED_ATTRIBUTES = ("id", "name", "description")
+
     id = Column(Integer, primary_key=True)
     name = Column(String(NAME_LENGTH))
     description = Column(String)
 
+    sensors = relationship("Sensor", back_populates="type")
+
     def __init__(self, id, name, description):
         self.id = id
         self.name = name
         self.description = description
 
-    @property
-    def serialized(self):
-        return convert2camel(self.serialize_attributes(("id", "name", "description")))
-
     @validates("name")
     def validates_name(self, key, name):
         assert (
@@ -145,6 +257,23 @@ class Sensor(BaseModel):
 
     __tablename__ = "sensor"
 
+    SERIALIZED_ATTRIBUTES = (
+        "id",
+        "name",
+        "description",
+        "channel",
+        "alert",
+        "zone_id",
+        "area_id",
+        "type_id",
+        "enabled",
+        "silent_alert",
+        "monitor_period",
+        "monitor_threshold",
+        "ui_order",
+        "ui_hidden",
+    )
+
     id = Column(Integer, primary_key=True)
     name = Column(String(16), nullable=False)
     description = Column(String, nullable=True)
@@ -166,7 +295,7 @@ class Sensor(BaseModel):
     area = relationship("Area", back_populates="sensors")
 
     type_id = Column(Integer, ForeignKey("sensor_type.id"), nullable=False)
-    type = relationship("SensorType", backref=backref("sensor_type", lazy="dynamic"))
+    type = relationship("SensorType", back_populates="sensors")
     alerts = relationship("AlertSensor", back_populates="sensor")
 
     ui_order = Column(Integer, nullable=True)
@@ -219,29 +348,6 @@ class Sensor(BaseModel):
             data,
         )
 
-    @property
-    def serialized(self):
-        return convert2camel(
-            self.serialize_attributes(
-                (
-                    "id",
-                    "name",
-                    "description",
-                    "channel",
-                    "alert",
-                    "zone_id",
-                    "area_id",
-                    "type_id",
-                    "enabled",
-                    "silent_alert",
-                    "monitor_period",
-                    "monitor_threshold",
-                    "ui_order",
-                    "ui_hidden",
-                )
-            )
-        )
-
     @validates("name")
     def validates_name(self, key, name):
         assert (
@@ -251,9 +357,7 @@ class Sensor(BaseModel):
 
     @validates("channel")
     def validates_channel(self, key, channel):
-        assert (
-            -1 <= channel <= int(os.environ["INPUT_NUMBER"])
-        ), f"Incorrect channel (0..{os.environ['INPUT_NUMBER']})"
+        assert -1 <= channel <= INPUT_NUMBER, f"Incorrect channel (0..{INPUT_NUMBER})"
         return channel
 
 
@@ -267,8 +371,10 @@ class Alert(BaseModel):
     end_time = Column(DateTime(timezone=True))
     silent = Column(Boolean, nullable=True, default=False)
 
-    sensors = relationship("AlertSensor", back_populates="alert")
-    arm: Mapped["Arm"] = relationship(back_populates="alert")
+    # the sensors are always serialized with the alert: load them in one query for all alerts
+    sensors = relationship("AlertSensor", back_populates="alert", lazy="selectin")
+    # the alert type depends on the arm type: join it to the alert query
+    arm: Mapped["Arm"] = relationship(back_populates="alert", lazy="joined")
     disarm: Mapped["Disarm"] = relationship(back_populates="alert")
 
     def __init__(self, arm, start_time, sensors, silent=None, end_time=None):
@@ -289,25 +395,16 @@ class Alert(BaseModel):
 
     @property
     def serialized(self):
-        locale.setlocale(locale.LC_ALL)
-        return convert2camel(
-            {
-                "id": self.id,
-                "alert_type": (
-                    Alert.get_alert_type(self.arm.type) if self.arm else ALERT_SABOTAGE
-                ),
-                "start_time": self.start_time.replace(
-                    microsecond=0, tzinfo=None
-                ).isoformat(sep=" "),
-                "end_time": (
-                    self.end_time.replace(microsecond=0, tzinfo=None).isoformat(sep=" ")
-                    if self.end_time
-                    else None
-                ),
-                "silent": self.silent,
-                "sensors": [alert_sensor.serialized for alert_sensor in self.sensors],
-            }
-        )
+        return {
+            "id": self.id,
+            "alertType": (
+                Alert.get_alert_type(self.arm.type) if self.arm else ALERT_SABOTAGE
+            ),
+            "startTime": format_datetime(self.start_time),
+            "endTime": format_datetime(self.end_time) if self.end_time else None,
+            "silent": self.silent,
+            "sensors": [alert_sensor.serialized for alert_sensor in self.sensors],
+        }
 
 
 class AlertSensor(BaseModel):
@@ -316,6 +413,21 @@ class AlertSensor(BaseModel):
     """
 
     __tablename__ = "alert_sensor"
+
+    SERIALIZED_ATTRIBUTES = (
+        "sensor_id",
+        "channel",
+        "type_id",
+        "name",
+        "description",
+        "start_time",
+        "end_time",
+        "delay",
+        "silent",
+        "monitor_period",
+        "monitor_threshold",
+    )
+
     alert_id = Column(Integer, ForeignKey("alert.id"), primary_key=True)
 
     sensor_id = Column(Integer, ForeignKey("sensor.id"), primary_key=True)
@@ -355,26 +467,6 @@ class AlertSensor(BaseModel):
         self.monitor_period = monitor_period
         self.monitor_threshold = monitor_threshold
 
-    @property
-    def serialized(self):
-        return convert2camel(
-            self.serialize_attributes(
-                (
-                    "sensor_id",
-                    "channel",
-                    "type_id",
-                    "name",
-                    "description",
-                    "start_time",
-                    "end_time",
-                    "delay",
-                    "silent",
-                    "monitor_period",
-                    "monitor_threshold",
-                )
-            )
-        )
-
 
 class Arm(BaseModel):
     """
@@ -382,6 +474,9 @@ class Arm(BaseModel):
     """
 
     __tablename__ = "arm"
+
+    SERIALIZED_ATTRIBUTES = ("type", "time", "keypad_id", "user_id")
+
     id = Column(Integer, primary_key=True)
     type = Column(Enum(ArmStates), nullable=False)
     time = Column(DateTime(timezone=True), nullable=False)
@@ -400,11 +495,6 @@ class Arm(BaseModel):
         self.keypad_id = keypad_id
         self.user_id = user_id
 
-    @property
-    def serialized(self):
-        response = self.serialize_attributes(("type", "time", "keypad_id", "user_id"))
-        return convert2camel(response)
-
 
 class Disarm(BaseModel):
     """
@@ -412,6 +502,9 @@ class Disarm(BaseModel):
     """
 
     __tablename__ = "disarm"
+
+    SERIALIZED_ATTRIBUTES = ("time", "keypad_id", "user_id")
+
     id = Column(Integer, primary_key=True)
     time = Column(DateTime(timezone=True))
     keypad_id = Column(Integer, ForeignKey("keypad.id"), nullable=True)
@@ -429,11 +522,6 @@ class Disarm(BaseModel):
         self.keypad_id = keypad_id
         self.user_id = user_id
 
-    @property
-    def serialized(self):
-        response = self.serialize_attributes(("time", "keypad_id", "user_id"))
-        return convert2camel(response)
-
 
 class ArmSensor(BaseModel):
     """
@@ -441,6 +529,18 @@ class ArmSensor(BaseModel):
     """
 
     __tablename__ = "arm_sensor"
+
+    SERIALIZED_ATTRIBUTES = (
+        "sensor_id",
+        "channel",
+        "type_id",
+        "name",
+        "description",
+        "timestamp",
+        "delay",
+        "enabled",
+    )
+
     id = Column(Integer, primary_key=True)
     arm_id = Column(Integer, ForeignKey("arm.id"))
     sensor_id = Column(Integer, ForeignKey("sensor.id"))
@@ -491,23 +591,6 @@ class ArmSensor(BaseModel):
             enabled=sensor.enabled,
         )
 
-    @property
-    def serialized(self):
-        return convert2camel(
-            self.serialize_attributes(
-                (
-                    "sensor_id",
-                    "channel",
-                    "type_id",
-                    "name",
-                    "description",
-                    "timestamp",
-                    "delay",
-                    "enabled",
-                )
-            )
-        )
-
 
 class Zone(BaseModel):
     """Model for zone table"""
@@ -516,6 +599,18 @@ class Zone(BaseModel):
 
     NAME_LENGTH = 32
 
+    SERIALIZED_ATTRIBUTES = (
+        "id",
+        "name",
+        "description",
+        "disarmed_delay",
+        "away_alert_delay",
+        "stay_alert_delay",
+        "away_arm_delay",
+        "stay_arm_delay",
+        "ui_order",
+    )
+
     id = Column(Integer, primary_key=True)
     name = Column(String(NAME_LENGTH), nullable=False)
     description = Column(String, nullable=False)
@@ -562,24 +657,6 @@ class Zone(BaseModel):
             data,
         )
 
-    @property
-    def serialized(self):
-        return convert2camel(
-            self.serialize_attributes(
-                (
-                    "id",
-                    "name",
-                    "description",
-                    "disarmed_delay",
-                    "away_alert_delay",
-                    "stay_alert_delay",
-                    "away_arm_delay",
-                    "stay_arm_delay",
-                    "ui_order",
-                )
-            )
-        )
-
     @validates(
         "disarmed_delay",
         "away_alert_delay",
@@ -606,6 +683,8 @@ class Area(BaseModel):
 
     NAME_LENGTH = 32
 
+    SERIALIZED_ATTRIBUTES = ("id", "name", "arm_state", "ui_order")
+
     id = Column(Integer, primary_key=True)
     name = Column(String(NAME_LENGTH), nullable=False)
     arm_state = Column(Enum(ArmStates), nullable=False)
@@ -620,12 +699,6 @@ class Area(BaseModel):
         self.name = name
         self.arm_state = ArmStates.DISARM
 
-    @property
-    def serialized(self):
-        return convert2camel(
-            self.serialize_attributes(("id", "name", "arm_state", "ui_order"))
-        )
-
     def update(self, data):
         return self.update_record(("name", "arm_state"), data)
 
@@ -654,7 +727,7 @@ class User(BaseModel):
     comment = Column(String, nullable=True)
 
     def __init__(self, name, role, access_code, fourkey_code=None):
-        self.id = int(str(uuid.uuid1(1000).int)[:8])
+        self.id = generate_id()
         self.name = name
         self.email = ""
         self.role = role
@@ -686,13 +759,13 @@ class User(BaseModel):
 
     def set_card_registration(self):
         self.update_record(
-            ("card_registration_expiry"),
+            ("card_registration_expiry",),
             {"card_registration_expiry": dt.now() + timedelta(seconds=60)},
         )
 
     def add_registration_code(self, registration_code=None, expiry=None):
         if not registration_code:
-            registration_code = str(uuid.uuid4()).upper().split("-")[-1]
+            registration_code = f"{uuid.uuid4().int & 0xFFFFFFFFFFFF:012X}"
 
         registration_expiry = None
         if expiry is None:
@@ -711,22 +784,20 @@ class User(BaseModel):
 
     @property
     def serialized(self):
-        return convert2camel(
-            {
-                "id": self.id,
-                "name": self.name,
-                "email": self.email,
-                "has_registration_code": bool(self.registration_code),
-                "has_card": bool(self.cards),
-                "registration_expiry": (
-                    self.registration_expiry.strftime("%Y-%m-%dT%H:%M:%S")
-                    if self.registration_expiry
-                    else None
-                ),
-                "role": self.role,
-                "comment": self.comment,
-            }
-        )
+        return {
+            "id": self.id,
+            "name": self.name,
+            "email": self.email,
+            "hasRegistrationCode": bool(self.registration_code),
+            "hasCard": bool(self.cards),
+            "registrationExpiry": (
+                format_datetime(self.registration_expiry, sep="T")
+                if self.registration_expiry
+                else None
+            ),
+            "role": self.role,
+            "comment": self.comment,
+        }
 
     @validates("name")
     def validates_name(self, key, name):
@@ -741,8 +812,7 @@ class User(BaseModel):
             0 <= len(email) <= User.EMAIL_LENGTH
         ), f"Incorrect email field length ({len(email)})"
         if len(email):
-            email_format = r"^[a-z0-9]+[\._]?[a-z0-9]+[@]\w+[.]\w{2,3}$"
-            assert search(email_format, email), "Invalid email format"
+            assert EMAIL_FORMAT.match(email), "Invalid email format"
         return email
 
 
@@ -750,6 +820,8 @@ class Card(BaseModel):
 
     __tablename__ = "card"
 
+    SERIALIZED_ATTRIBUTES = ("id", "user_id", "description", "enabled")
+
     id = Column(Integer, primary_key=True)
     code = Column(String(64), nullable=False)
     user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
@@ -757,7 +829,7 @@ class Card(BaseModel):
     description = Column(String, nullable=True)
 
     def __init__(self, card, owner_id, description=None):
-        self.id = int(str(uuid.uuid1(1000).int)[:8])
+        self.id = generate_id()
         self.code = hash_code(card)
         self.user_id = owner_id
         self.description = description or self.generate_card_description()
@@ -765,24 +837,17 @@ class Card(BaseModel):
 
     @staticmethod
     def generate_card_description():
-        """Example: 2021-10-30_08:15_284"""
-        return f"{dt.now().isoformat().replace('T', ' ')[:16]} ({str(uuid.uuid1(1000).int)[:3]})"
+        """Example: 2021-10-30 08:15 (284)"""
+        now = dt.now()
+        return (
+            f"{now.year:04}-{now.month:02}-{now.day:02} {now.hour:02}:{now.minute:02}"
+            f" ({100 + randbelow(900)})"
+        )
 
     def update(self, data):
         fields = ("enabled", "description")
         return self.update_record(fields, data)
 
-    @property
-    def serialized(self):
-        return convert2camel(
-            {
-                "id": self.id,
-                "user_id": self.user_id,
-                "description": self.description,
-                "enabled": self.enabled,
-            }
-        )
-
 
 class Option(BaseModel):
     """Model for option table"""
@@ -808,22 +873,25 @@ class Option(BaseModel):
             return True
         else:
             tmp_value = json.loads(self.value)
-            merge_dicts(tmp_value, value)
-            tmp_value = json.dumps(tmp_value)
-            changed = self.value != tmp_value
-            self.value = tmp_value
-            return changed
+            if not merge_dicts(tmp_value, value):
+                return False
+
+            self.value = json.dumps(tmp_value)
+            return True
 
     @property
     def serialized(self):
-        filtered_value = deepcopy(json.loads(self.value))
+        # the parsed value is a new object, it can be modified in place
+        filtered_value = json.loads(self.value)
         replace_keys(
-            filtered_value, {"smtp_password": "******", "replace_empty": False}
-        )
-        replace_keys(filtered_value, {"password": "******", "replace_empty": False})
-        return convert2camel(
-            {"name": self.name, "section": self.section, "value": filtered_value}
+            filtered_value,
+            {
+                "smtp_password": "******",
+                "password": "******",
+                "replace_empty": False,
+            },
         )
+        return {"name": self.name, "section": self.section, "value": filtered_value}
 
     @validates("name", "section")
     def validates_name(self, key, value):
@@ -855,11 +923,13 @@ class Keypad(BaseModel):
 
     __tablename__ = "keypad"
 
+    SERIALIZED_ATTRIBUTES = ("id", "type_id", "enabled")
+
     id = Column(Integer, primary_key=True)
     enabled = Column(Boolean, default=True)
 
     type_id = Column(Integer, ForeignKey("keypad_type.id"), nullable=False)
-    type = relationship("KeypadType", backref=backref("keypad_type", lazy="dynamic"))
+    type = relationship("KeypadType", back_populates="keypads")
 
     def __init__(self, keypad_type, enabled=True):
         self.type = keypad_type
@@ -868,29 +938,25 @@ class Keypad(BaseModel):
     def update(self, data):
         return self.update_record(("enabled", "type_id"), data)
 
-    @property
-    def serialized(self):
-        return convert2camel(self.serialize_attributes(("id", "type_id", "enabled")))
-
 
 class KeypadType(BaseModel):
     """Model for keypad type table"""
 
     __tablename__ = "keypad_type"
 
+    SERIALIZED_ATTRIBUTES = ("id", "name", "description")
+
     id = Column(Integer, primary_key=True)
     name = Column(String(32))
     description = Column(String)
 
+    keypads = relationship("Keypad", back_populates="type")
+
     def __init__(self, id, name, description):
         self.id = id
         self.name = name
         self.description = description
 
-    @property
-    def serialized(self):
-        return convert2camel(self.serialize_attributes(("id", "name", "description")))
-
 
 class OutputTriggerType(str, enum.Enum):
     """
@@ -909,6 +975,21 @@ class Output(BaseModel):
 
     ENDLESS_DURATION = 0
 
+    SERIALIZED_ATTRIBUTES = (
+        "id",
+        "name",
+        "description",
+        "channel",
+        "state",
+        "trigger_type",
+        "area_id",
+        "delay",
+        "duration",
+        "default_state",
+        "enabled",
+        "ui_order",
+    )
+
     id = Column(Integer, primary_key=True)
     name = Column(String(16), nullable=True)
     description = Column(String, nullable=True)
@@ -972,33 +1053,12 @@ class Output(BaseModel):
             data,
         )
 
-    @property
-    def serialized(self):
-        return convert2camel(
-            self.serialize_attributes(
-                (
-                    "id",
-                    "name",
-                    "description",
-                    "channel",
-                    "state",
-                    "trigger_type",
-                    "area_id",
-                    "delay",
-                    "duration",
-                    "default_state",
-                    "enabled",
-                    "ui_order",
-                )
-            )
-        )
-
     @validates("channel")
     def validates_channel(self, key, channel):
         if channel is not None:
             assert (
-                0 <= channel <= int(os.environ["OUTPUT_NUMBER"])
-            ), f"Incorrect channel (0..{os.environ['OUTPUT_NUMBER']})"
+                0 <= channel <= OUTPUT_NUMBER
+            ), f"Incorrect channel (0..{OUTPUT_NUMBER})"
         return channel
 
     @validates("duration")
@@ -20,7 +20,7 @@ CH13_PIN = 23
 CH14_PIN = 24
 CH15_PIN = 25
 
-CHANNEL_GPIO_PINS = [
+CHANNEL_GPIO_PINS = (
     CH01_PIN,
     CH02_PIN,
     CH03_PIN,
@@ -36,7 +36,7 @@ CHANNEL_GPIO_PINS = [
     CH13_PIN,
     CH14_PIN,
     CH15_PIN,
-]
+)
 
 # Power pin
 POWER_PIN = 8
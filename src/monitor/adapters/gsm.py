@@ -2,6 +2,7 @@ import logging
 from multiprocessing import Event
 import re
 from enum import Enum
+from functools import partial
 from time import sleep
 
 from serial.serialutil import PortNotOpenError
@@ -35,12 +36,19 @@ class CallResult(Enum):
 
 
 CALL_ACKNOWLEDGED = "1"
+DTMF_WAIT_SECONDS = 20
+DTMF_POLL_PERIOD = 0.2
+
+# fix for call status parsing of SIM900
+CALL_STATUS_PATTERN = re.compile(r'^\+CLCC:\s+(\d+),(\d),(\d),(\d),([^,]),"([^,]*)",(\d+)')
 
 
 class GSM:
 
     CONNECTS = 0
-    RETRY_GAP_SECONDS = 5
+    # retry gaps: 1, 2, 4, 8, 10 seconds (total retry sleep <= 25 s)
+    RETRY_GAP_SECONDS = 1
+    MAX_RETRY_GAP_SECONDS = 10
     MAX_RETRY = 5
 
     call_event = Event()
@@ -82,8 +90,7 @@ class GSM:
                 self._modem.connect(self._pin_code)
 
                 # fix for call status parsing of SIM900
-                self._modem._pollCallStatusRegex = \
-                    re.compile('^\+CLCC:\s+(\d+),(\d),(\d),(\d),([^,]),"([^,]*)",(\d+)')
+                self._modem._pollCallStatusRegex = CALL_STATUS_PATTERN
 
                 self._logger.info("GSM modem connected")
                 return True
@@ -108,8 +115,12 @@ class GSM:
 
             attempts += 1
             if attempts <= GSM.MAX_RETRY:
-                self._logger.info("Retrying to connect in %s seconds...", GSM.RETRY_GAP_SECONDS)
-                sleep(GSM.RETRY_GAP_SECONDS)
+                # double the gap after every failed attempt
+                retry_gap = min(
+                    GSM.RETRY_GAP_SECONDS * 2 ** (attempts - 1), GSM.MAX_RETRY_GAP_SECONDS
+                )
+                self._logger.info("Retrying to connect in %s seconds...", retry_gap)
+                sleep(retry_gap)
             else:
                 self._logger.error("Failed to connect to GSM modem!")
                 return False
@@ -241,17 +252,29 @@ class GSM:
             if call_type == CallType.ALERT:
                 self._logger.info("Alert call to number='%s'", phone_number)
                 self._modem.dial(
-                    number=phone_number, timeout=30, callStatusUpdateCallbackFunc=GSM.play_alert
+                    number=phone_number,
+                    timeout=30,
+                    callStatusUpdateCallbackFunc=partial(
+                        GSM.play_alert, is_acknowledged=self.is_acknowledged
+                    )
                 )
             elif call_type == CallType.PANIC:
                 self._logger.info("Panic call to number='%s'", phone_number)
                 self._modem.dial(
-                    number=phone_number, timeout=30, callStatusUpdateCallbackFunc=GSM.play_panic
+                    number=phone_number,
+                    timeout=30,
+                    callStatusUpdateCallbackFunc=partial(
+                        GSM.play_panic, is_acknowledged=self.is_acknowledged
+                    )
                 )
             elif call_type == CallType.TEST:
                 self._logger.info("Test call to number='%s'", phone_number)
                 self._modem.dial(
-                    number=phone_number, timeout=30, callStatusUpdateCallbackFunc=GSM.play_test
+                    number=phone_number,
+                    timeout=30,
+                    callStatusUpdateCallbackFunc=partial(
+                        GSM.play_test, is_acknowledged=self.is_acknowledged
+                    )
                 )
             else:
                 self._logger.error("Unknown call type %s", call_type)
@@ -277,7 +300,7 @@ class GSM:
             call_result.name,
             self._modem.dtmfpool
         )
-        if self._modem.dtmfpool == [CALL_ACKNOWLEDGED]:
+        if self.is_acknowledged():
             self._logger.debug("Call was acknowledged")
             call_result = CallResult.ACKNOWLEDGED
 
@@ -291,8 +314,12 @@ class GSM:
     def incoming_dtmf(self) -> str:
         return "".join(self._modem.dtmfpool)
 
+    def is_acknowledged(self) -> bool:
+        """Check if the called party acknowledged the call with the DTMF tone"""
+        return self._modem is not None and self._modem.dtmfpool == [CALL_ACKNOWLEDGED]
+
     @staticmethod
-    def play_dtmf(call: Call, dtmf: str):
+    def play_dtmf(call: Call, dtmf: str, is_acknowledged):
         logger = logging.getLogger(LOG_ADGSM)
         logger.debug(
             "Manage call with DTMF tones: answered=%s, active=%s, state=%s",
@@ -317,8 +344,11 @@ class GSM:
                     logger.error("DTMF playback failed: %s", e)
                     GSM.call_result = CallResult.FAILED
 
-                # wait for incoming dtmf
-                sleep(20)
+                # wait for incoming dtmf (until acknowledged or the call ends)
+                waited = 0
+                while waited < DTMF_WAIT_SECONDS and call.active and not is_acknowledged():
+                    sleep(DTMF_POLL_PERIOD)
+                    waited += DTMF_POLL_PERIOD
 
                 try:
                     logger.debug("Hanging up call...")
@@ -336,25 +366,25 @@ class GSM:
             GSM.call_event.set()
 
     @staticmethod
-    def play_alert(call: Call):
+    def play_alert(call: Call, is_acknowledged):
         logger = logging.getLogger(LOG_ADGSM)
         logger.debug("Manage alert call")
 
-        GSM.play_dtmf(call, "111")
+        GSM.play_dtmf(call, "111", is_acknowledged)
 
     @staticmethod
-    def play_panic(call):
+    def play_panic(call, is_acknowledged):
         logger = logging.getLogger(LOG_ADGSM)
         logger.debug("Manage panic call")
 
-        GSM.play_dtmf(call, "00000")
+        GSM.play_dtmf(call, "00000", is_acknowledged)
 
     @staticmethod
-    def play_test(call):
+    def play_test(call, is_acknowledged):
         logger = logging.getLogger(LOG_ADGSM)
         logger.debug("Manage test call")
 
-        GSM.play_dtmf(call, "5")
+        GSM.play_dtmf(call, "5", is_acknowledged)
 
     def destroy(self):
         if self._modem:
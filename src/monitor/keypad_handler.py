@@ -3,7 +3,7 @@ import logging
 from datetime import datetime as dt
 from queue import Empty, Queue
 from threading import Thread
-from time import sleep, time
+from time import monotonic, sleep
 
 from constants import (ARM_AWAY, ARM_DISARM, ARM_STAY, LOG_ADKEYPAD,
                        MONITOR_ARM_AWAY, MONITOR_ARM_STAY, MONITOR_DISARM,
@@ -27,7 +27,11 @@ from tools.queries import (
 
 
 COMMUNICATION_PERIOD = 0.2  # sec
+IDLE_PERIOD = 1  # sec
 CARD_REGISTRATION_EXPIRY = 120  # sec
+PRESSES_TIMEOUT = 10  # sec
+ARM_WAIT_TIMEOUT = 5  # sec
+MAX_ARM_POLL_PERIOD = 0.5  # sec
 
 
 class KeypadHandler(Thread):
@@ -79,21 +83,24 @@ class KeypadHandler(Thread):
         self._logger.info("Keypad handler stopped")
 
     def communicate(self):
-        last_press = int(time())
+        clear_presses_at = monotonic() + PRESSES_TIMEOUT
         presses = ""
         register_card_start = None
         while True:
             with contextlib.suppress(Empty):
                 self._logger.trace("Wait for command...")
-                message = self._actions.get(timeout=COMMUNICATION_PERIOD)
+                # without keypad only the messages and the card registration need handling
+                message = self._actions.get(
+                    timeout=COMMUNICATION_PERIOD if self._keypad is not None else IDLE_PERIOD
+                )
                 self._logger.debug("Command: %s", message)
 
                 if message["action"] == MONITOR_UPDATE_KEYPAD:
                     self._logger.info("Updating keypad")
                     self.configure()
-                    last_press = int(time())
+                    clear_presses_at = monotonic() + PRESSES_TIMEOUT
                 elif message["action"] == MONITOR_REGISTER_CARD:
-                    register_card_start = time()
+                    register_card_start = monotonic()
                 elif message["action"] == MONITOR_ARM_AWAY and self._keypad:
                     self.arm_keypad(ARM_AWAY, message.get("use_delay", True))
                 elif message["action"] == MONITOR_ARM_STAY and self._keypad:
@@ -110,24 +117,24 @@ class KeypadHandler(Thread):
                 elif message["action"] == MONITOR_STOP:
                     break
 
-            if register_card_start and time() - register_card_start > CARD_REGISTRATION_EXPIRY:
+            if register_card_start and monotonic() - register_card_start > CARD_REGISTRATION_EXPIRY:
                 register_card_start = None
                 send_card_not_registered()
 
             if self._keypad is not None:
                 self._keypad.communicate()
 
-                # delete pressed keys after 10 secs
-                if int(time()) - last_press > 10 and presses:
+                # delete pressed keys after PRESSES_TIMEOUT
+                if presses and monotonic() >= clear_presses_at:
                     presses = ""
-                    self._logger.info("Cleared presses after 10 secs")
+                    self._logger.info("Cleared presses after %s secs", PRESSES_TIMEOUT)
 
                 # check the action from the keypad
                 action = self._keypad.last_action()
                 if action == Action.KEY:
                     presses += self._keypad.get_last_key()
                     self._logger.trace("Presses: '%s'", presses)
-                    last_press = time()
+                    clear_presses_at = monotonic() + PRESSES_TIMEOUT
                     if len(presses) == 4:
                         self.handle_access_code(presses)
                         presses = ""
@@ -149,13 +156,15 @@ class KeypadHandler(Thread):
             self._keypad.set_armed(True)
 
             # wait for the arm created in the database
-            # synchronizing the two threads
-            arm = None
-            retries = 5
-            while not arm and retries > 0:
+            # synchronizing the two threads (polling with growing gaps)
+            arm = session.query(Arm).filter_by(disarm=None).first()
+            poll_period = 0.05
+            waited = 0
+            while not arm and waited < ARM_WAIT_TIMEOUT:
+                sleep(poll_period)
+                waited += poll_period
+                poll_period = min(poll_period * 2, MAX_ARM_POLL_PERIOD)
                 arm = session.query(Arm).filter_by(disarm=None).first()
-                retries -= 1
-                sleep(1)
 
             if not arm:
                 self._logger.error("Arm not created")
@@ -224,15 +233,9 @@ class KeypadHandler(Thread):
 
     def get_card_by_number(self, number) -> Card:
         with get_database_session() as db_session:
-            users = db_session.query(User).all()
-
-            cards = []
-            for user in users:
-                cards.extend(user.cards)
-
             card_hash = hash_code(number)
-            self._logger.debug("Card %s/%s in %s", number, card_hash, [c.code for c in cards])
-            return next(filter(lambda c: c.code == card_hash, cards), None)
+            self._logger.debug("Card %s/%s", number, card_hash)
+            return db_session.query(Card).filter_by(code=card_hash).first()
 
     def register_card(self, card):
         """Find the first user from the database with valid card registration"""
@@ -8,6 +8,7 @@ from os import environ
 from time import sleep
 
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
 from constants import (
     ALERT_AWAY,
@@ -178,7 +179,10 @@ class SensorHandler:
         """
         Publish the sensor configuration to the MQTT.
         """
-        sensors = self._db_session.execute(select(Sensor)).scalars().all()
+        # load the sensor types with the sensors for the published config
+        sensors = self._db_session.execute(
+            select(Sensor).options(selectinload(Sensor.type))
+        ).scalars().all()
         for sensor in sensors:
             if not sensor.deleted:
                 self._mqtt_client.publish_sensor_config(
@@ -19,17 +19,15 @@ sensor_blueprint = Blueprint("sensor", __name__)
 def view_sensors():
     current_app.logger.debug("Request->alerting: %s", request.args.get("alerting"))
     if not request.args.get("alerting"):
-        return jsonify(
-            [
-                i.serialized
-                for i in db.session.query(Sensor)
-                .filter_by(deleted=False)
-                .order_by(Sensor.channel.asc())
-            ]
+        query = (
+            Sensor.select_serialized()
+            .filter_by(deleted=False)
+            .order_by(Sensor.channel.asc())
         )
-    return jsonify(
-        [i.serialized for i in db.session.query(Sensor).filter_by(alert=True).all()]
-    )
+    else:
+        query = Sensor.select_serialized().filter_by(alert=True)
+
+    return jsonify(Sensor.serialize_rows(db.session.execute(query)))
 
 
 @sensor_blueprint.route("/api/sensors/", methods=["POST"])
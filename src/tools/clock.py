@@ -14,6 +14,7 @@ from constants import LOG_CLOCK
 
 
 TIME1970 = 2208988800
+RTC_TIME_PATTERN = re.compile(r"RTC time: [a-zA-Z]{0,4} ([0-9\-: ]*)")
 
 
 class Clock:
@@ -39,7 +40,7 @@ class Clock:
 
     def get_time_hw(self):
         try:
-            result = re.search("RTC time: [a-zA-Z]{0,4} ([0-9\\-: ]*)", check_output("timedatectl").decode("utf-8"))
+            result = RTC_TIME_PATTERN.search(check_output("timedatectl").decode("utf-8"))
             if result:
                 return result.group(1)
         except CalledProcessError:
@@ -54,8 +55,9 @@ class Clock:
         Get the uptime of the system in seconds
         """
         try:
-            return int(float(check_output("cat /proc/uptime", shell=True).decode("utf-8").split(" ")[0]))
-        except CalledProcessError:
+            with open("/proc/uptime", "r", encoding="utf-8") as uptime_file:
+                return int(float(uptime_file.read().split(" ")[0]))
+        except OSError:
             return None
         
     def get_service_uptime(self, service):
@@ -7,30 +7,40 @@ import copy
 
 
 def merge_dicts(target, source):
-    if source is None:
-        return
-    if target is None:
-        target = source
-        return
+    """
+    Merge the source dictionary into the target recursively.
+    Return true if the target changed.
+    """
+    if source is None or target is None:
+        return False
 
+    changed = False
     for k, v in source.items():
         if type(v) == list:
             if k not in target:
                 target[k] = copy.deepcopy(v)
-            else:
+                changed = True
+            elif v:
                 target[k].extend(v)
+                changed = True
         elif type(v) == dict:
             if k not in target:
                 target[k] = copy.deepcopy(v)
+                changed = True
             else:
-                merge_dicts(target[k], v)
+                changed = merge_dicts(target[k], v) or changed
         elif type(v) == set:
             if k not in target:
                 target[k] = v.copy()
-            else:
+                changed = True
+            elif not v <= target[k]:
                 target[k].update(v.copy())
-        else:
+                changed = True
+        elif k not in target or type(target[k]) != type(v) or target[k] != v:
             target[k] = copy.copy(v)
+            changed = True
+
+    return changed
 
 
 def filter_keys(data, keys=[]):
@@ -47,10 +47,9 @@ def get_alert_delay(session, arm_type):
 
 
 def get_user_with_access_code(session, code) -> User:
-    users = session.query(User).all()
     code_hash = hash_code(code)
-    logger.debug("User access code %s/%s in %s", code, code_hash, [u.fourkey_code for u in users])
-    return next(filter(lambda u: u.fourkey_code == code_hash, users), None)
+    logger.debug("User access code %s/%s", code, code_hash)
+    return session.query(User).filter_by(fourkey_code=code_hash).first()
 
 
 def get_arm_state(session):
@@ -7,6 +7,7 @@ import os
 import re
 import subprocess
 import sys
+import tempfile
 
 from dotenv import load_dotenv
 
@@ -91,13 +92,16 @@ class SSHKeyManager:
                 os.mkdir(os.path.expanduser("~/.ssh"))
             os.mknod(self.authorized_keys_path)
 
-        if self.check_key_exists(key_name):
+        with open(self.authorized_keys_path, "r", encoding="utf-8") as key_file:
+            keys = key_file.readlines()
+
+        other_keys = [line for line in keys if key_name not in line]
+        if len(other_keys) != len(keys):
             self._logger.info(
                 "Replacing public key (new) '%s...' with name %s",
                 public_key.split(" ")[1][:10],
                 key_name,
             )
-            os.system(f'sed -i "/{key_name}/d" {self.authorized_keys_path}')
         else:
             self._logger.info(
                 "Adding public key '%s...' with name %s",
@@ -105,9 +109,21 @@ class SSHKeyManager:
                 key_name,
             )
 
-        os.system(
-            f'echo "{public_key}" >> {os.path.expanduser(self.authorized_keys_path)}'
-        )
+        if other_keys and not other_keys[-1].endswith("\n"):
+            other_keys[-1] += "\n"
+        other_keys.append(f"{public_key}\n")
+
+        # write a temporary file and rename it over the original (like sed -i)
+        # so the keys are never lost by a truncated file
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=os.path.dirname(self.authorized_keys_path),
+            delete=False,
+        ) as key_file:
+            key_file.writelines(other_keys)
+        os.chmod(key_file.name, os.stat(self.authorized_keys_path).st_mode)
+        os.replace(key_file.name, self.authorized_keys_path)
 
     def remove_public_key(self, key_name: str):
         """
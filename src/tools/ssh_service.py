@@ -5,6 +5,7 @@ from ipaddress import ip_network
 import logging
 import os
 import sys
+import tempfile
 
 from dotenv import load_dotenv
 from gi.repository import GLib
@@ -66,13 +67,35 @@ class SSHService:
 
         if enable:
             self._logger.info("Restrict SSH access only for %s to %s", network, enable)
-            os.system("sed -i '/sshd:/d' /etc/hosts.allow")
-            os.system(f"echo 'sshd: {network}' >> /etc/hosts.allow")
-            os.system("echo 'sshd: ALL' >> /etc/hosts.deny")
+            self._remove_lines("/etc/hosts.allow", "sshd:")
+            with open("/etc/hosts.allow", "a", encoding="utf-8") as hosts_file:
+                hosts_file.write(f"sshd: {network}\n")
+            with open("/etc/hosts.deny", "a", encoding="utf-8") as hosts_file:
+                hosts_file.write("sshd: ALL\n")
         else:
             self._logger.info("Allow SSH access from any networks")
-            os.system("sed -i '/sshd:/d' /etc/hosts.allow")
-            os.system("sed -i '/sshd: ALL/d' /etc/hosts.deny")
+            self._remove_lines("/etc/hosts.allow", "sshd:")
+            self._remove_lines("/etc/hosts.deny", "sshd: ALL")
+
+    @staticmethod
+    def _remove_lines(path, text):
+        """
+        Remove the lines containing the text from the file (like sed -i '/text/d')
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as hosts_file:
+                lines = [line for line in hosts_file if text not in line]
+        except FileNotFoundError:
+            return
+
+        # write a temporary file and rename it over the original (like sed -i)
+        # so the file is never left truncated
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=os.path.dirname(path), delete=False
+        ) as hosts_file:
+            hosts_file.writelines(lines)
+        os.chmod(hosts_file.name, os.stat(path).st_mode)
+        os.replace(hosts_file.name, path)
 
     def update_password_authentication(self):
         """